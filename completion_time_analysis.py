@@ -7,9 +7,10 @@ Feature 2: Issue Completion Time Analysis (Focused)
 """
 
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from functools import cached_property
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from data_loader import DataLoader
@@ -19,28 +20,18 @@ import config
 
 # ----------------------------- helpers ------------------------------------ #
 
-def _closed_at_from_events(issue: Issue) -> Optional[datetime]:
-    """Find closed date from events."""
-    cands = []
-    for e in issue.events:
-        if e.event_type and e.event_type.lower() == "closed" and e.event_date:
-            cands.append(e.event_date)
-    return max(cands) if cands else None
-
-def _closed_at(issue: Issue) -> Optional[datetime]:
-    """Get closed date from issue events, or fallback to updated_date if closed."""
-    ts = _closed_at_from_events(issue)
-    if ts:
-        return ts
-    # Fallback: if issue is closed, use updated_date
-    if issue.state == State.closed:
-        return issue.updated_date
-    return None
-
 def _labels(issue: Issue) -> List[str]:
     """Get labels from issue."""
     return issue.labels if issue.labels else ["unlabeled"]
 
+def _flatten_labels(df: pd.DataFrame, value_cols: List[str]) -> pd.DataFrame:
+    """One row per (issue, label) pair, carrying the given value columns."""
+    return df[["labels", *value_cols]].explode("labels").dropna(subset=["labels"])
+
+def _days_between(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Whole days (floored) from start to end over datetime64 arrays; NaN where either is NaT."""
+    return np.floor((end - start) / np.timedelta64(1, "D"))
+
 def _url(issue: Issue) -> Optional[str]:
     """Get URL from issue."""
     return issue.url if issue.url else f"https://github.com/python-poetry/poetry/issues/{issue.number}" if issue.number >= 0 else None
@@ -52,40 +43,85 @@ class CompletionAnalysis:
     CLOSED issues only. One chart + concise summary.
     """
 
-    def __init__(self):
-        self.issues: List[Issue] = DataLoader().get_issues()
+    def __init__(self, issues: Optional[List[Issue]] = None):
+        self.issues: List[Issue] = issues if issues is not None else DataLoader().get_issues()
         self.user_filter: Optional[str] = config.get_parameter("user")
         self.label_filter: Optional[str] = config.get_parameter("label")
         self.since: Optional[str] = config.get_parameter("since")
-        self.filtered_issues = self._filter_issues()
-
-    def _filter_issues(self) -> List[Issue]:
-        items = self.issues
+        self.plot: bool = config.get_parameter("plot", True)
+        self._index_dates()
+
+    @cached_property
+    def filtered_idx(self) -> List[int]:
+        """Positions of the issues passing the filters; computed on first use."""
+        return self._filter_issues()
+
+    def _invalidate(self) -> None:
+        """Drops the cached filter result after the filters have changed."""
+        self.__dict__.pop("filtered_idx", None)
+
+    def _index_dates(self) -> None:
+        """
+        Converts the created, updated and closed-event dates of all issues
+        into UTC DatetimeIndexes (one vectorized pass each). Issues are then
+        referred to by their position in self.issues.
+        """
+        self.created_arr = pd.to_datetime([i.created_date for i in self.issues], utc=True, errors="coerce", cache=True)
+        self.updated_arr = pd.to_datetime([i.updated_date for i in self.issues], utc=True, errors="coerce", cache=True)
+        # collect all "closed" events as parallel columns, then keep the latest per issue
+        ev_idx, ev_date = [], []
+        for k, issue in enumerate(self.issues):
+            for e in issue.events:
+                if e.event_type_lower == "closed" and e.event_date:
+                    ev_idx.append(k)
+                    ev_date.append(e.event_date)
+        closed_events = pd.Series(pd.to_datetime(ev_date, utc=True, errors="coerce", cache=True), index=ev_idx)
+        self.closed_event_arr = pd.DatetimeIndex(closed_events.groupby(level=0).max().reindex(range(len(self.issues))))
+        self.frame = self._build_frame()
+
+    def _filter_issues(self) -> List[int]:
+        """Positions of issues matching the user/label/since filters, as one fused mask."""
+        mask = np.ones(len(self.frame), dtype=bool)
         if self.user_filter:
-            items = [i for i in items if i.creator == self.user_filter]
+            mask &= (self.frame["creator"] == self.user_filter).to_numpy()
         if self.label_filter:
-            items = [i for i in items if self.label_filter in _labels(i)]
+            mask &= np.fromiter((self.label_filter in labs for labs in self.frame["labels"]), dtype=bool, count=len(mask))
         if self.since:
             start = pd.to_datetime(self.since, utc=True, errors="coerce")
             if not pd.isna(start):
-                items = [i for i in items if i.created_date and i.created_date >= start.to_pydatetime()]
-        return items
-
-    def _completion_days(self, issue: Issue) -> Optional[float]:
-        if issue.state != State.closed:
-            return None
-        c0 = issue.created_date
-        c1 = _closed_at(issue)
-        if not c0 or not c1:
-            return None
-        d = (c1 - c0).days
-        return d if d >= 0 else None
+                mask &= (self.frame["created_at"] >= start).to_numpy()
+        return np.flatnonzero(mask).tolist()
+
+    def _build_frame(self) -> pd.DataFrame:
+        """
+        Materializes one row per issue (aligned with self.issues) and computes
+        closed_at / completion_time column-wise. closed_at falls back to the
+        updated date for closed issues without a "closed" event.
+        """
+        frame = pd.DataFrame({
+            "issue_number": [i.number for i in self.issues],
+            "created_at": self.created_arr,
+            "updated_at": self.updated_arr,
+            "closed_event_at": self.closed_event_arr,
+            "is_closed": [i.state == State.closed for i in self.issues],
+            "labels": [_labels(i) for i in self.issues],
+            "creator": [i.creator for i in self.issues],
+            "title": [i.title or "" for i in self.issues],
+            "url": [_url(i) for i in self.issues],
+        })
+        closed_at = frame["closed_event_at"].fillna(frame["updated_at"])
+        frame["closed_at"] = closed_at.where(frame["is_closed"])
+        days = _days_between(frame["created_at"].dt.tz_localize(None).to_numpy(),
+                             frame["closed_at"].dt.tz_localize(None).to_numpy())
+        frame["completion_time"] = np.where(days >= 0, days, np.nan)
+        frame["closed_month"] = frame["closed_at"].dt.tz_localize(None).dt.to_period("M").astype(str)
+        return frame
 
     def run(self) -> Dict[str, Any]:
         print("\n" + "=" * 80)
         print("FEATURE 2: ISSUE COMPLETION TIME ANALYSIS (Closed Issues Only)")
         print("=" * 80)
-        print(f"Analyzing {len(self.filtered_issues)} issues")
+        print(f"Analyzing {len(self.filtered_idx)} issues")
         if self.user_filter:
             print(f"Filtered by user:  {self.user_filter}")
         if self.label_filter:
@@ -94,7 +130,8 @@ class CompletionAnalysis:
             print(f"Since (created ≥): {self.since}")
         print()
 
-        closed = [i for i in self.filtered_issues if i.state == State.closed]
+        is_closed = self.frame["is_closed"].to_numpy()
+        closed = [k for k in self.filtered_idx if is_closed[k]]
         print(f"Found {len(closed)} closed issues")
 
         res = self._analyze_closed_issues(closed)
@@ -103,39 +140,30 @@ class CompletionAnalysis:
             return {"closed": {}}
         return {"closed": res}
 
-    def _analyze_closed_issues(self, closed_issues: List[Issue]) -> Optional[Dict[str, Any]]:
-        rows = []
-        for it in closed_issues:
-            d = self._completion_days(it)
-            if d is not None:
-                rows.append({
-                    "issue_number": it.number,
-                    "completion_time": d,
-                    "labels": _labels(it),
-                    "title": it.title or "",
-                    "url": _url(it),
-                    "closed_at": _closed_at(it),
-                })
-        if not rows:
+    def _analyze_closed_issues(self, closed_idx: List[int]) -> Optional[Dict[str, Any]]:
+        cols = ["issue_number", "completion_time", "labels", "title", "url", "closed_at", "closed_month"]
+        df = self.frame.iloc[closed_idx][cols].dropna(subset=["completion_time"]).reset_index(drop=True)
+        if df.empty:
             return None
+        # whole days as integers, like timedelta.days; the NaNs were dropped above
+        df["completion_time"] = df["completion_time"].astype("int64")
 
-        df = pd.DataFrame.from_records(rows)
-        s = df["completion_time"]
+        arr = df["completion_time"].to_numpy(dtype=np.float64)
 
         # concise summary
-        mean = float(s.mean())
-        median = float(s.median())
-        p90 = float(s.quantile(0.90))
+        mean = float(arr.mean())
+        median, p90 = (float(q) for q in np.quantile(arr, [0.5, 0.9]))
         print(f"\nClosed issues analyzed: {len(df)}")
         print(f"Median time-to-close: {median:.1f} d  |  Mean: {mean:.1f} d  |  P90: {p90:.1f} d")
 
         # fastest / slowest labels (sample ≥ 3)
-        lbl_df = df[["labels", "completion_time"]].explode("labels")
+        lbl_df = _flatten_labels(df, ["completion_time", "closed_month"])
+        # stable sort so ties on the median still yield distinct first/last labels
         stats = (
             lbl_df.groupby("labels")["completion_time"]
             .agg(["median", "count"])
             .query("count >= 3")
-            .sort_values("median", ascending=True)
+            .sort_values("median", ascending=True, kind="stable")
         )
         if not stats.empty:
             fastest = stats.iloc[0]
@@ -148,8 +176,6 @@ class CompletionAnalysis:
             print("\nNo closed timestamps available to plot monthly trend.")
             return {"completion_df": df, "summary": {"count": len(df), "median": median, "mean": mean, "p90": p90}}
 
-        df["closed_month"] = pd.to_datetime(df["closed_at"], utc=True).dt.tz_localize(None).dt.to_period("M").astype(str)
-
         overall = (
             df.groupby("closed_month")["completion_time"]
             .median()
@@ -162,10 +188,8 @@ class CompletionAnalysis:
         top_labels = label_counts.head(3).index.tolist()
 
         if top_labels:
-            # Recreate lbl_df with closed_month for monthly analysis
-            lbl_df_monthly = df[["labels", "closed_month", "completion_time"]].explode("labels")
             label_lines = (
-                lbl_df_monthly[lbl_df_monthly["labels"].isin(top_labels)]
+                lbl_df[lbl_df["labels"].isin(top_labels)]
                 .groupby(["labels", "closed_month"])["completion_time"]
                 .median()
                 .reset_index()
@@ -174,7 +198,8 @@ class CompletionAnalysis:
         else:
             label_lines = pd.DataFrame()
 
-        self._plot_monthly_medians(overall, label_lines)
+        if self.plot:
+            self._plot_monthly_medians(overall, label_lines)
         return {"completion_df": df, "summary": {"count": len(df), "median": median, "mean": mean, "p90": p90}}
 
     # --------------------------- plot --------------------------- #
@@ -204,13 +229,10 @@ class CompletionAnalysis:
 # --------------------------- module API ----------------------------------- #
 
 def run(issues: List[Issue] = None, config_dict: Dict = None) -> Dict[str, Any]:
-    analysis = CompletionAnalysis()
-    if issues is not None:
-        analysis.issues = issues
-        analysis.filtered_issues = analysis._filter_issues()
+    analysis = CompletionAnalysis(issues)
     if config_dict and "since" in config_dict:
         analysis.since = str(config_dict["since"])
-        analysis.filtered_issues = analysis._filter_issues()
+        analysis._invalidate()
     return analysis.run()
 
 if __name__ == "__main__":
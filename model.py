@@ -6,9 +6,24 @@ the properties contained in the issues JSON.
 from typing import List, Dict, Set, Tuple
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser
 
 
+@lru_cache(maxsize=200_000)
+def _parse_date(value: str) -> datetime:
+    """
+    Parses a date string. Memoized since many events and issues
+    share the same timestamp strings. GitHub timestamps are ISO 8601
+    (e.g. 2024-01-31T12:00:00Z), which the standard library parses
+    much faster than dateutil; anything else falls back to dateutil.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parser.parse(value)
+
+
 class State(str, Enum):
     """
     Whether issue is open or closed.
@@ -21,6 +36,7 @@ class Event:
     
     def __init__(self, jobj:any):
         self.event_type:str = None
+        self.event_type_lower:str = ''
         self.author:str = None
         self.event_date:datetime = None
         self.label:str = None
@@ -31,9 +47,11 @@ class Event:
     
     def from_json(self, jobj:any):
         self.event_type = jobj.get('event_type')
+        # normalized once here so analyses don't lowercase per comparison
+        self.event_type_lower = (self.event_type or '').lower()
         self.author = jobj.get('author')
         try:
-            self.event_date = parser.parse(jobj.get('event_date'))
+            self.event_date = _parse_date(jobj.get('event_date'))
         except:
             pass
         self.label = jobj.get('label')
@@ -72,11 +90,11 @@ class Issue:
         except:
             pass
         try:
-            self.created_date = parser.parse(jobj.get('created_date'))
+            self.created_date = _parse_date(jobj.get('created_date'))
         except:
             pass
         try:
-            self.updated_date = parser.parse(jobj.get('updated_date'))
+            self.updated_date = _parse_date(jobj.get('updated_date'))
         except:
             pass
         self.timeline_url = jobj.get('timeline_url')
@@ -41,6 +41,10 @@ def parse_args():
     ap.add_argument('--since', type=str, required=False,
                     help='Filter issues created on or after this date (YYYY-MM or YYYY-MM-DD)')
 
+    # Optional flag to skip building charts, e.g. for headless runs (Features 2 and 3)
+    ap.add_argument('--no-plot', dest='plot', action='store_false', default=None,
+                    help='Only print the summary; do not build or show charts')
+
     return ap.parse_args()
 
 
@@ -1,5 +1,6 @@
 from typing import List, Optional
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from datetime import timedelta
 from data_loader import DataLoader
@@ -10,65 +11,88 @@ class TriageTimeAnalysis:
     def __init__(self):
         if config.get_parameter("user") or config.get_parameter("label"):
             raise RuntimeError("This analysis does not support the 'user' or 'label' flags")
+        self.plot: bool = config.get_parameter("plot", True)
         
     def run(self):
         """
         Main entry point for triage time analysis.
-        Calls triage_time_analysis with show_plot=True by default.
+        Calls triage_time_analysis with show_plot=True unless --no-plot was given.
         """
-        self.triage_time_analysis(show_plot=True)
+        self.triage_time_analysis(show_plot=self.plot)
 
     def _first_assignment_event(self, issue: Issue) -> Optional[Event]:
+        """
+        Earliest assignment event of the issue, found in a single pass
+        rather than by sorting all of its events.
+        """
         created = issue.created_date
         if created is None:
             return None
-        sorted_events = sorted(issue.events, key=lambda ev: ev.event_date or created)
-        for e in sorted_events:
-            if not getattr(e, "event_type", None):
+        best, best_ts = None, None
+        for e in issue.events:
+            if not e.event_type:
                 continue
-            et = e.event_type
-            if et == "assigned":
-                return e
-            if e.comment and "assign" in e.comment.lower():
-                return e
-        return None
+            if e.event_type != "assigned" and not (e.comment and "assign" in e.comment.lower()):
+                continue
+            ts = e.event_date or created
+            # strict comparison keeps the earlier event on ties, like a stable sort
+            if best_ts is None or ts < best_ts:
+                best, best_ts = e, ts
+        return best
 
-    def triage_time_analysis(self, show_plot: bool = False) -> pd.DataFrame:
+    def _compute_triage_seconds(self, issues: List[Issue]) -> pd.DataFrame:
         """
-        Compute time from issue creation to first ASSIGNED event, expressed in days.
-        Returns a DataFrame with triage times in days and prints summary stats.
+        Scans the issues once and returns, for every issue with an assignment
+        event, the time from creation to first assignment in seconds. Other
+        units (hours, days, ...) are cheap divisions of the triage_seconds column.
         """
-        issues: List[Issue] = DataLoader().get_issues()
-        rows = []
+        numbers, creators, created_dates, assigned_dates = [], [], [], []
         for issue in issues:
             created = issue.created_date
             if created is None:
                 continue
             first_assigned = self._first_assignment_event(issue)
-            if first_assigned and getattr(first_assigned, "event_date", None):
-                delta = first_assigned.event_date - created
-                # convert to days (float)
-                days = delta.total_seconds() / 3600.0 / 24.0
-                rows.append({
-                    "issue_number": issue.number,
-                    "creator": issue.creator,
-                    "created_date": created,
-                    "assigned_date": first_assigned.event_date,
-                    "triage_days": days
-                })
+            if first_assigned and first_assigned.event_date:
+                numbers.append(issue.number)
+                creators.append(issue.creator)
+                created_dates.append(created)
+                assigned_dates.append(first_assigned.event_date)
+
+        created_arr = pd.to_datetime(created_dates, utc=True)
+        assigned_arr = pd.to_datetime(assigned_dates, utc=True)
+        # one vectorized datetime64 subtraction for all issues
+        seconds = (assigned_arr - created_arr) / np.timedelta64(1, "s")
 
-        df = pd.DataFrame.from_records(rows)
+        return pd.DataFrame({
+            "issue_number": np.asarray(numbers, dtype=np.int64),
+            "creator": creators,
+            "created_date": created_arr,
+            "assigned_date": assigned_arr,
+            "triage_seconds": np.asarray(seconds, dtype=np.float64)
+        })
+
+    def triage_time_analysis(self, show_plot: bool = False) -> pd.DataFrame:
+        """
+        Compute time from issue creation to first ASSIGNED event, expressed in days.
+        Returns a DataFrame with triage times in days and prints summary stats.
+        """
+        issues: List[Issue] = DataLoader().get_issues()
+        df = self._compute_triage_seconds(issues)
         if df.empty:
             print("No triage/assignment events found in dataset.")
-            return df
+            return pd.DataFrame()
+        # seconds stay internal; the returned frame reports days only
+        df["triage_days"] = df.pop("triage_seconds") / 3600.0 / 24.0
 
+        days = df["triage_days"].to_numpy(dtype=np.float64)
         summary = {
-            "count": int(df.shape[0]),
-            "mean_days": float(df["triage_days"].mean()),
-            "median_days": float(df["triage_days"].median()),
-            "min_days": float(df["triage_days"].min()),
-            "max_days": float(df["triage_days"].max()),
-            "std_days": float(df["triage_days"].std())
+            "count": int(days.size),
+            "mean_days": float(days.mean()),
+            "median_days": float(np.median(days)),
+            "min_days": float(days.min()),
+            "max_days": float(days.max()),
+            # sample standard deviation, as pandas' Series.std computes it
+            "std_days": float(days.std(ddof=1)) if days.size > 1 else float("nan")
         }
 
         print("Triage time summary (days):")
@@ -76,8 +100,9 @@ class TriageTimeAnalysis:
             print(f"  {k}: {v}")
 
         if show_plot:
+            counts, edges = np.histogram(days, bins=40)
             plt.figure(figsize=(10, 5))
-            plt.hist(df["triage_days"], bins=40, color="#2a9d8f", edgecolor="black")
+            plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge", color="#2a9d8f", edgecolor="black")
             plt.title("Distribution of triage time (days)")
             plt.xlabel("Days from creation to first assignment")
             plt.ylabel("Number of issues")
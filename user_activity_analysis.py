@@ -1,5 +1,7 @@
 from typing import List
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 
 from data_loader import DataLoader
 from labels import AREA_LABELS, KIND_LABELS
@@ -20,10 +22,10 @@ class UserActivityAnalysis:
         self._user: str = config.get_parameter('user')
         if config.get_parameter('label'):
             raise RuntimeError("--label flag is not supported for feature 1")
+        # the chart is this feature's only output, so it cannot be skipped
+        if config.get_parameter('plot') is False:
+            raise RuntimeError("--no-plot flag is not supported for feature 1")
         
-    def _event_to_year_month(self, e):
-        return f"{e["event_date"].year}-{e["event_date"].month:02d}"
-    
     def run(self):
         """
         Starting point for this analysis.
@@ -35,68 +37,53 @@ class UserActivityAnalysis:
         print("Loading issues...")
         issues: List[Issue] = DataLoader().get_issues()
         
-        # Get all issues authored by the user
-        # structure them like events with type "opened" for easier processing alongside other events
+        # Activity is kept column-wise: one date and one label list per action.
+        # Opening an issue counts as an action alongside the user's other events.
         print("Gathering opened issues...")
-        events = [
-            {
-                "event_type": "opened",
-                "event_date": i.created_date,
-                "author": user,
-                "labels": i.labels
-            } for i in issues
-            if i.creator == user
-        ]
+        opened = [i for i in issues if i.creator == user]
+        event_dates = [i.created_date for i in opened]
+        event_labels = [i.labels for i in opened]
         
         print("Gathering all other activity...")
         for i in issues:
             for e in i.events:
                 if e.author == user:
-                    events.append(
-                        {
-                            "event_type": e.event_type,
-                            "event_date": e.event_date,
-                            "author": user,
-                            "labels": i.labels,
-                        }
-                    )
-        
-        events.sort(key=lambda e: e["event_date"])
+                    event_dates.append(e.event_date)
+                    event_labels.append(i.labels)
         
-        year_month_buckets = {self._event_to_year_month(e) for e in events}
+        # chronological order via one argsort over the datetime64 column
+        dates = pd.to_datetime(event_dates, utc=True).tz_localize(None).to_numpy()
+        order = np.argsort(dates, kind="stable")
+        order = order[~np.isnat(dates[order])]
+        dates = dates[order]
+        event_labels = [event_labels[k] for k in order]
         
+        # year-month key of every event, formatted in one vectorized pass
+        year_months = pd.DatetimeIndex(dates).to_period("M").astype(str)
+        # events are sorted by date, so unique keys come out in chronological order
+        year_month_bucket_list = list(pd.unique(year_months))
+
         print("Collecting activity stats by label by month...")
-        activity_by_label_by_year_month = {}
-        for e in events:
-            bucket = self._event_to_year_month(e)
-            if bucket not in activity_by_label_by_year_month:
-                activity_by_label_by_year_month[bucket] = {}
-            for label in e["labels"]:
-                if label not in activity_by_label_by_year_month[bucket]:
-                    activity_by_label_by_year_month[bucket][label] = 0
-                activity_by_label_by_year_month[bucket][label] += 1
-        
+        # one row per (event, label), counted into a year_month x label matrix
+        activity = pd.DataFrame({
+            "year_month": year_months,
+            "label": event_labels,
+        }).explode("label").dropna()
+        counts = activity.pivot_table(index="year_month", columns="label", aggfunc="size", fill_value=0)
+
         print("Collecting 'area' activity by month...")
-        area_activity = {area: [] for area in AREA_LABELS}
-        for year_month in sorted(activity_by_label_by_year_month.keys()):
-            for area in AREA_LABELS:
-                area_activity[area].append(activity_by_label_by_year_month[year_month].get(area, 0))
-            
+        area_activity = counts.reindex(index=year_month_bucket_list, columns=AREA_LABELS, fill_value=0)
+
         print("Collecting 'kind' activity by month...")
-        kind_activity = {kind: [] for kind in KIND_LABELS}
-        for year_month in sorted(activity_by_label_by_year_month.keys()):
-            for kind in KIND_LABELS:
-                kind_activity[kind].append(activity_by_label_by_year_month[year_month].get(kind, 0))
-        
+        kind_activity = counts.reindex(index=year_month_bucket_list, columns=KIND_LABELS, fill_value=0)
+
         fig, (ax1, ax2) = plt.subplots(2, 1, sharex=True, sharey=True)
         fig.suptitle(f"Activity of {user}")
-        
-        year_month_bucket_list = sorted(list(year_month_buckets))
-        
+
         ax1.stackplot(
             year_month_bucket_list,
-            area_activity.values(),
-            labels=[area.lstrip("area/") for area in area_activity.keys()],
+            area_activity.T.values,
+            labels=[area.lstrip("area/") for area in AREA_LABELS],
             colors=[
                 "#0bb4ff", "#50e991", "#e6d800", "#9b19f5", "#ffa300", "#dc0ab4", "#b3d4ff", "#00bfa0", "#fd7f6f", "#7eb0d5",
                 "#ea5545", "#f46a9b", "#ef9b20", "#edbf33", "#ede15b", "#bdcf32", "#87bc45", "#27aeef", "#b33dc6", "#e60049",
@@ -109,8 +96,8 @@ class UserActivityAnalysis:
         
         ax2.stackplot(
             year_month_bucket_list,
-            kind_activity.values(),
-            labels=[kind.lstrip("kind/") for kind in kind_activity.keys()],
+            kind_activity.T.values,
+            labels=[kind.lstrip("kind/") for kind in KIND_LABELS],
             mouseover=True,
         )
         ax2.legend(reverse=True)